@@ -27,6 +27,16 @@ class ProductSearchResponse(BaseModel):
     query: str
     results: List[dict]
 
+class Suggestion(BaseModel):
+    text: str
+    type: str # 'item', 'line'
+    lines: List[str]
+    popularity: int
+
+class SuggestResponse(BaseModel):
+    prefix: str
+    suggestions: List[Suggestion]
+
 class LineInfoResponse(BaseModel):
     line_name: str
     items_sold: List[str]
@@ -147,6 +157,17 @@ async def search_product(q: str = Query(..., description="Product name to search
     
     return ProductSearchResponse(query=q, results=results)
 
+@router.get("/product/suggest", response_model=SuggestResponse)
+async def suggest_product(
+    prefix: str = Query(..., description="Partial item or line name typed so far"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of completions")
+):
+    """
+    Typeahead completions for item and line names, most popular first.
+    """
+    suggestions = data_loader.suggest(prefix, limit)
+    return SuggestResponse(prefix=prefix, suggestions=suggestions)
+
 @router.get("/line/info/{line_name}", response_model=LineInfoResponse)
 async def get_line_info(line_name: str):
     line = data_loader.get_line_by_name(line_name)
@@ -3,6 +3,7 @@ import os
 from typing import Dict, List, Optional
 from pypdf import PdfReader
 from app.core.config import settings
+from app.services.prefix_index import PrefixIndex
 
 class DataLoader:
     def __init__(self):
@@ -10,6 +11,7 @@ class DataLoader:
         self.history_text: str = ""
         self.lines: List[Dict] = []
         self._load_data()
+        self.prefix_index = PrefixIndex(self.lines)
 
     def _load_data(self):
         # Load JSON
@@ -66,6 +68,9 @@ class DataLoader:
                     break
         return results
 
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict]:
+        return self.prefix_index.suggest(prefix, limit)
+
     def get_history(self) -> str:
         return self.history_text
 
@@ -0,0 +1,51 @@
+import heapq
+from bisect import bisect_left
+from typing import Dict, List
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index over item names and line names.
+    Each term is ranked by popularity: the number of lines it points to.
+    """
+    def __init__(self, lines: List[Dict]):
+        self._keys: List[str] = []
+        self._entries: List[Dict] = []
+        self._build(lines)
+
+    def _build(self, lines: List[Dict]):
+        terms: Dict[tuple, Dict] = {}
+        for line in lines:
+            line_name = line.get("line_name", "")
+            if line_name:
+                terms.setdefault((line_name.lower(), "line"), {
+                    "text": line_name,
+                    "type": "line",
+                    "lines": [line_name],
+                })
+            for item in line.get("items_sold", []):
+                entry = terms.setdefault((item.lower(), "item"), {
+                    "text": item,
+                    "type": "item",
+                    "lines": [],
+                })
+                if line_name and line_name not in entry["lines"]:
+                    entry["lines"].append(line_name)
+
+        for key in sorted(terms):
+            entry = terms[key]
+            entry["popularity"] = len(entry["lines"])
+            self._keys.append(key[0])
+            self._entries.append(entry)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict]:
+        # A blank prefix matches every term, giving the overall most popular
+        prefix = prefix.strip().lower()
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + chr(0x10FFFF), lo=start)
+        # Most popular first, alphabetical on ties
+        ranked = heapq.nsmallest(
+            limit,
+            range(start, end),
+            key=lambda i: (-self._entries[i]["popularity"], self._keys[i]),
+        )
+        return [dict(self._entries[i], lines=list(self._entries[i]["lines"])) for i in ranked]
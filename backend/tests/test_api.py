@@ -17,6 +17,36 @@ def test_search_product():
     assert len(data["results"]) > 0
     assert "Blessed Line" in [r["line_name"] for r in data["results"]]
 
+def test_suggest_product():
+    response = client.get("/product/suggest?prefix=sh")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["prefix"] == "sh"
+    texts = [s["text"] for s in data["suggestions"]]
+    assert "shoes" in texts
+    assert all(t.lower().startswith("sh") for t in texts)
+    popularity = [s["popularity"] for s in data["suggestions"]]
+    assert popularity == sorted(popularity, reverse=True)
+
+def test_suggest_product_line_name_and_limit():
+    response = client.get("/product/suggest?prefix=b&limit=1")
+    assert response.status_code == 200
+    suggestions = response.json()["suggestions"]
+    assert len(suggestions) == 1
+    assert suggestions[0]["text"] == "babystuff"
+
+    response = client.get("/product/suggest?prefix=mothers")
+    data = response.json()
+    assert {"text": "Mothers Line", "type": "line", "lines": ["Mothers Line"], "popularity": 1} in data["suggestions"]
+
+def test_suggest_product_blank_prefix():
+    # Blank prefixes return the overall most popular terms, ties alphabetical
+    for prefix in ["", "%20%20"]:
+        response = client.get(f"/product/suggest?prefix={prefix}&limit=4")
+        assert response.status_code == 200
+        texts = [s["text"] for s in response.json()["suggestions"]]
+        assert texts == ["clothes", "babystuff", "kitchenutensils", "shoes"]
+
 def test_get_line_info():
     response = client.get("/line/info/Mothers Line")
     assert response.status_code == 200